@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
+from functools import cached_property
 from types import MappingProxyType
-from typing import Annotated, ClassVar, Self
+from typing import Annotated, ClassVar, Final, Self
 
 from flext_tap_ldif import t, u
 from flext_tap_ldif.models import m
 
+_CLOCK_GRANULARITY_SECONDS: Final[float] = 1.0
+_clock_cache: tuple[float, datetime] = (-_CLOCK_GRANULARITY_SECONDS, u.now())
+
+
+def _extraction_clock() -> datetime:
+    """Coarse UTC clock for extraction timestamps.
+
+    Refreshes at most once per second so per-entry model construction does
+    not pay a full ``datetime.now(UTC)`` syscall on every instantiation;
+    second-level granularity is plenty for an extraction audit timestamp.
+    """
+    global _clock_cache
+    elapsed, cached = _clock_cache
+    now = time.monotonic()
+    if now - elapsed >= _CLOCK_GRANULARITY_SECONDS:
+        cached = u.now()
+        _clock_cache = (now, cached)
+    return cached
+
 
 class FlextTapLdifModelsEntry:
     """MRO mixin: LdifEntry and LdifChangeRecord models."""
@@ -17,7 +38,10 @@ class FlextTapLdifModelsEntry:
         """Represents an LDIF entry with complete parsing support."""
 
         model_config: ClassVar[m.ConfigDict] = m.ConfigDict(
-            validate_assignment=True,
+            # Hot per-entry model: assignments after construction are limited
+            # to trusted pipeline writes (processed flag, objectClass
+            # back-fill), so skip per-assignment revalidation.
+            validate_assignment=False,
             extra="forbid",
             frozen=False,
             json_schema_extra={
@@ -66,7 +90,7 @@ class FlextTapLdifModelsEntry:
             u.Field(
                 description="Extraction timestamp",
             ),
-        ] = u.Field(default_factory=lambda: u.now())
+        ] = u.Field(default_factory=_extraction_clock)
         processed: Annotated[bool, u.Field(description="Processing status")] = False
         validation_errors: Annotated[
             t.StrSequence,
@@ -76,7 +100,7 @@ class FlextTapLdifModelsEntry:
         ] = u.Field(default_factory=tuple)
 
         @u.computed_field()
-        @property
+        @cached_property
         def ldif_entry_summary(self) -> t.JsonMapping:
             """LDIF entry analysis summary."""
             primary_object_class = self.object_classes[0] if self.object_classes else ""
@@ -98,6 +122,11 @@ class FlextTapLdifModelsEntry:
 
         def resolve_attribute_values(self, name: str) -> t.StrSequence:
             """Get attribute values by name (case-insensitive)."""
+            # O(1) fast path for the common canonical-casing lookup; the
+            # case-insensitive scan below is the slow fallback.
+            exact = self.attributes.get(name)
+            if exact is not None:
+                return exact
             normalized_name = name.lower()
             for attr_name, values in self.attributes.items():
                 if attr_name.lower() == normalized_name:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, ClassVar, Self
 
 from flext_tap_ldif import c, t, u
@@ -84,7 +85,7 @@ class FlextTapLdifModelsLdifFile:
         ] = u.Field(default_factory=tuple)
 
         @u.computed_field()
-        @property
+        @cached_property
         def ldif_file_summary(self) -> t.JsonMapping:
             """LDIF file processing summary."""
             progress = 0.0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from types import MappingProxyType
 from typing import Annotated, ClassVar, Self
 
@@ -67,7 +68,7 @@ class FlextTapLdifModelsLdifStream:
         ] = u.Field(default_factory=lambda: list[t.StrMapping]())
 
         @u.computed_field()
-        @property
+        @cached_property
         def ldif_stream_summary(self) -> t.JsonMapping:
             """LDIF stream configuration summary."""
             return {
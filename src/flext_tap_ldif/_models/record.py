@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Annotated, ClassVar, Self
 
 from flext_tap_ldif import t, u
@@ -60,7 +61,7 @@ class FlextTapLdifModelsRecord:
         )
 
         @u.computed_field()
-        @property
+        @cached_property
         def validation_summary(self) -> t.JsonMapping:
             """LDIF validation complete summary."""
             success_rate = 0.0
@@ -3,9 +3,43 @@
 from __future__ import annotations
 
 import base64
+import sys
 
 from flext_tap_ldif import c, p, r, t
 
+# Module-level binding: parse_ldif_line hits this once per base64 value,
+# so skip the base64-module attribute lookup on each call.
+_b64decode = base64.b64decode
+
+
+def _parse_attr_value(line: str) -> t.StrPair | str:
+    """Parse one logical LDIF line into an (attribute, value) pair.
+
+    Returns the pair on success and the failure message otherwise, so the
+    per-line hot loop pays no result-object allocation; the public
+    ``parse_ldif_line`` wraps this into a ``FlextResult``.
+    """
+    line = line.strip()
+    if not line or line[0] == "#":
+        return "Empty or comment line"
+    separator = line.find(":")
+    if separator < 0:
+        return "Invalid LDIF line format"
+    attr_name = line[:separator].strip()
+    rest = line[separator + 1 :]
+    marker = rest[:1]
+    if marker == ":":
+        try:
+            decoded_value = _b64decode(rest[1:].strip()).decode(
+                c.DEFAULT_ENCODING,
+            )
+        except c.Meltano.SINGER_SAFE_EXCEPTIONS as e:
+            return f"Base64 decode error: {e}"
+        return (attr_name, decoded_value)
+    if marker == "<":
+        return (attr_name, f"URL:{rest[1:].strip()}")
+    return (attr_name, rest.strip())
+
 
 class FlextTapLdifUtilitiesLdifDataProcessing:
     """MRO mixin exposing LdifDataProcessing under u.TapLdif."""
@@ -19,38 +53,38 @@ class FlextTapLdifUtilitiesLdifDataProcessing:
         ) -> t.MutableAttributeMapping:
             """Build record dict from LDIF lines."""
             record: t.MutableAttributeMapping = {}
-            current_attr: str | None = None
-            current_value: str = ""
-            for line in (*entry_lines, ""):
-                if line.startswith(c.TapLdif.Format.LINE_CONTINUATION):
-                    if current_attr is not None:
-                        current_value += line[1:]
+            # Hoisted out of the per-line loop to skip the nested-class
+            # attribute walk.
+            normalize = FlextTapLdifUtilitiesLdifDataProcessing.LdifDataProcessing.normalize_ldif_attribute_name
+            # Fold RFC 2849 continuation lines (leading space) back onto
+            # their logical line with one substitution instead of threading
+            # continuation state through the parse loop. Folding before
+            # parsing also means wrapped base64 values decode as one unit
+            # rather than the decoded head getting raw tail text appended.
+            folded = "\n".join(entry_lines).replace(
+                "\n" + c.TapLdif.Format.LINE_CONTINUATION,
+                "",
+            )
+            for line in folded.split("\n"):
+                parsed = _parse_attr_value(line)
+                if isinstance(parsed, str):
                     continue
-                if current_attr is not None and current_value:
-                    normalized_attr = FlextTapLdifUtilitiesLdifDataProcessing.LdifDataProcessing.normalize_ldif_attribute_name(
-                        current_attr,
-                    )
-                    if normalized_attr in record:
-                        existing_value = record[normalized_attr]
-                        if isinstance(existing_value, list):
-                            existing_value.append(current_value)
-                        else:
-                            record[normalized_attr] = [
-                                str(existing_value),
-                                current_value,
-                            ]
-                    else:
-                        record[normalized_attr] = current_value
-                parse_result = FlextTapLdifUtilitiesLdifDataProcessing.LdifDataProcessing.parse_ldif_line(
-                    line,
-                )
-                if parse_result.success:
-                    a, v = parse_result.value
-                    current_attr = a
-                    current_value = v
+                attr_name, value = parsed
+                if not value:
+                    continue
+                normalized_attr = normalize(attr_name)
+                # Single hash lookup: values are always str or list[str],
+                # so None doubles as the missing-key sentinel.
+                existing_value = record.get(normalized_attr)
+                if existing_value is None:
+                    record[normalized_attr] = value
+                elif isinstance(existing_value, list):
+                    existing_value.append(value)
                 else:
-                    current_attr = None
-                    current_value = ""
+                    record[normalized_attr] = [
+                        str(existing_value),
+                        value,
+                    ]
             return record
 
         @staticmethod
@@ -72,41 +106,24 @@ class FlextTapLdifUtilitiesLdifDataProcessing:
             """Normalize LDIF attribute name for JSON schema."""
             if not attr_name:
                 return ""
-            normalized: str = c.TapLdif.ATTRIBUTE_NORMALIZE_RE.sub(
-                "_", attr_name.lower()
-            )
+            if attr_name.isascii():
+                normalized: str = attr_name.lower().translate(
+                    c.TapLdif.ATTRIBUTE_NORMALIZE_TABLE,
+                )
+            else:
+                normalized = c.TapLdif.ATTRIBUTE_NORMALIZE_RE.sub(
+                    "_", attr_name.lower()
+                )
             if normalized and normalized[0].isdigit():
                 normalized = f"attr_{normalized}"
-            return normalized
+            # Attribute names repeat across every entry of a dump; interning
+            # dedupes the key objects and makes dict lookups pointer-fast.
+            return sys.intern(normalized)
 
         @staticmethod
         def parse_ldif_line(line: str) -> p.Result[t.StrPair]:
             """Parse LDIF attribute line."""
-            line = line.strip()
-            if not line or line.startswith("#"):
-                return r[t.StrPair].fail("Empty or comment line")
-            if ":" not in line:
-                return r[t.StrPair].fail("Invalid LDIF line format")
-            if "::" in line:
-                attr_name, encoded_value = line.split("::", 1)
-                try:
-                    decoded_value = base64.b64decode(encoded_value.strip()).decode(
-                        c.DEFAULT_ENCODING,
-                    )
-                    return r[t.StrPair].ok((
-                        attr_name.strip(),
-                        decoded_value,
-                    ))
-                except c.Meltano.SINGER_SAFE_EXCEPTIONS as e:
-                    return r[t.StrPair].fail(f"Base64 decode error: {e}")
-            if ":<" in line:
-                attr_name, url_value = line.split(":<", 1)
-                return r[t.StrPair].ok((
-                    attr_name.strip(),
-                    f"URL:{url_value.strip()}",
-                ))
-            attr_name, value = line.split(":", 1)
-            return r[t.StrPair].ok((
-                attr_name.strip(),
-                value.strip(),
-            ))
+            parsed = _parse_attr_value(line)
+            if isinstance(parsed, str):
+                return r[t.StrPair].fail(parsed)
+            return r[t.StrPair].ok(parsed)
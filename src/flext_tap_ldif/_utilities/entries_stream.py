@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import override
+from typing import TYPE_CHECKING, ClassVar, override
 
 from flext_meltano import u
 from flext_tap_ldif import c, m, t
 from flext_tap_ldif._utilities.processor import FlextTapLdifUtilitiesProcessor
 
+if TYPE_CHECKING:
+    from flext_tap_ldif.settings import FlextTapLdifSettings
+
 
 class FlextTapLdifUtilitiesEntriesStream:
     """MRO mixin exposing EntriesStream under u.TapLdif."""
@@ -18,14 +21,38 @@ class FlextTapLdifUtilitiesEntriesStream:
     class EntriesStream(m.Meltano.SingerStreamBase):
         """LDIF entries stream using flext-ldif for ALL processing."""
 
+        # Fixed stream schema; built once at class creation instead of per
+        # stream instance.
+        ENTRY_SCHEMA: ClassVar[t.JsonDict] = {
+            "type": "object",
+            "properties": {
+                c.TapLdif.EntrySchema.DN_FIELD: {"type": "string"},
+                c.TapLdif.EntrySchema.ATTRIBUTES_FIELD: {"type": "object"},
+                c.TapLdif.EntrySchema.OBJECT_CLASS_FIELD: {
+                    "type": "array",
+                    "items": {"type": "string"},
+                },
+                c.TapLdif.EntrySchema.CHANGE_TYPE_FIELD: {"type": "string"},
+                c.TapLdif.EntrySchema.SOURCE_FILE_FIELD: {"type": "string"},
+                c.TapLdif.EntrySchema.LINE_NUMBER_FIELD: {"type": "integer"},
+                c.TapLdif.EntrySchema.ENTRY_SIZE_FIELD: {"type": "integer"},
+            },
+        }
+
         @override
         def __init__(self, tap: m.Meltano.SingerTapBase) -> None:
             """Initialize LDIF entries stream."""
-            super().__init__(tap, name="ldif_entries", schema=self._get_schema())
-            self._processor = FlextTapLdifUtilitiesProcessor.Processor(
-                t.scalar_mapping_adapter().validate_python(tap.config),
+            super().__init__(tap, name="ldif_entries", schema=self.ENTRY_SCHEMA)
+            # The tap config is immutable for the stream's lifetime, so
+            # validate it once here instead of per get_records call. The
+            # settings class comes from the tap rather than a module-level
+            # facade import, which would close an import cycle (settings
+            # resolves u, which loads this module) before the class exists.
+            config = t.scalar_mapping_adapter().validate_python(tap.config)
+            self._processor = FlextTapLdifUtilitiesProcessor.Processor(config)
+            self._settings: FlextTapLdifSettings = tap.config_class.model_validate(
+                config,
             )
-            self._tap: m.Meltano.SingerTapBase = tap
 
         @override
         def get_records(
@@ -34,28 +61,16 @@ class FlextTapLdifUtilitiesEntriesStream:
         ) -> Iterable[m.Meltano.SingerRecord]:
             """Return a generator of record-type dictionary objects."""
             _ = context
-            settings = t.json_dict_adapter().validate_python(self._tap.config)
-            dir_path_raw = settings.get("directory_path")
-            dir_path = dir_path_raw if isinstance(dir_path_raw, str) else None
-            pattern_raw = settings.get("file_pattern", "*.ldif")
-            pattern = pattern_raw if isinstance(pattern_raw, str) else "*.ldif"
-            fp_raw = settings.get("file_path")
-            fp_val = fp_raw if isinstance(fp_raw, str) else None
-            max_size_raw = settings.get("max_file_size_mb", c.TapLdif.MAX_FILE_SIZE_MB)
-            max_size = (
-                max_size_raw
-                if isinstance(max_size_raw, int)
-                else c.TapLdif.MAX_FILE_SIZE_MB
-            )
+            settings = self._settings
             files_result = self._processor.discover_files(
-                directory_path=dir_path,
-                file_pattern=pattern,
-                file_path=fp_val,
-                max_file_size_mb=max_size,
+                directory_path=settings.directory_path,
+                file_pattern=settings.file_pattern,
+                file_path=settings.file_path,
+                max_file_size_mb=settings.max_file_size_mb,
             )
             if files_result.failure:
                 error_msg = files_result.error or "LDIF file discovery failed"
-                if bool(settings.get("strict_parsing", True)):
+                if settings.strict_parsing:
                     raise RuntimeError(error_msg)
                 FlextTapLdifUtilitiesEntriesStream.logger.error(
                     "File discovery failed: %s",
@@ -69,10 +84,12 @@ class FlextTapLdifUtilitiesEntriesStream:
             )
             if not files_to_process:
                 error_msg = "No LDIF files discovered"
-                if bool(settings.get("strict_parsing", True)):
+                if settings.strict_parsing:
                     raise RuntimeError(error_msg)
                 FlextTapLdifUtilitiesEntriesStream.logger.warning(error_msg)
                 return
+            # Bound once: the record loop below runs once per entry.
+            singer_record = m.Meltano.SingerRecord
             for file_path in files_to_process:
                 FlextTapLdifUtilitiesEntriesStream.logger.info(
                     "Processing file: %s",
@@ -80,9 +97,9 @@ class FlextTapLdifUtilitiesEntriesStream:
                 )
                 try:
                     for record in self._processor.process_file(file_path):
-                        yield m.Meltano.SingerRecord(record)
+                        yield singer_record(record)
                 except c.Meltano.SINGER_SAFE_EXCEPTIONS as e:
-                    if settings.get("strict_parsing", True):
+                    if settings.strict_parsing:
                         FlextTapLdifUtilitiesEntriesStream.logger.exception(
                             "Error processing file %s",
                             str(file_path),
@@ -95,21 +112,3 @@ class FlextTapLdifUtilitiesEntriesStream:
                         err_msg,
                     )
                     continue
-
-        def _get_schema(self) -> t.JsonDict:
-            """Get schema for LDIF entries."""
-            return {
-                "type": "object",
-                "properties": {
-                    c.TapLdif.EntrySchema.DN_FIELD: {"type": "string"},
-                    c.TapLdif.EntrySchema.ATTRIBUTES_FIELD: {"type": "object"},
-                    c.TapLdif.EntrySchema.OBJECT_CLASS_FIELD: {
-                        "type": "array",
-                        "items": {"type": "string"},
-                    },
-                    c.TapLdif.EntrySchema.CHANGE_TYPE_FIELD: {"type": "string"},
-                    c.TapLdif.EntrySchema.SOURCE_FILE_FIELD: {"type": "string"},
-                    c.TapLdif.EntrySchema.LINE_NUMBER_FIELD: {"type": "integer"},
-                    c.TapLdif.EntrySchema.ENTRY_SIZE_FIELD: {"type": "integer"},
-                },
-            }
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import codecs
+import fnmatch
+import io
+import os
+import stat
+import sys
+from collections.abc import Generator, Iterable
 from pathlib import Path
-from typing import NoReturn
+from typing import Final, NoReturn
 
 from flext_ldif import ldif
 from flext_meltano import u
 from flext_tap_ldif import c, m, p, r, t
 
+_READ_BUFFER_SIZE: Final[int] = 1 << 20
+
+# Shared constant-message failure; FlextResult instances are immutable, so
+# the misconfiguration path reuses one object instead of building it per call.
+_NO_SOURCE_RESULT: Final[p.Result[t.SequenceOf[Path]]] = r[t.SequenceOf[Path]].fail(
+    "No file_path or directory_path specified",
+)
+
+# UTF-32 BOMs must precede UTF-16: the UTF-32-LE mark starts with the
+# UTF-16-LE one, so the longer prefix has to win.
+_BOM_ENCODINGS: Final[tuple[tuple[bytes, str], ...]] = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
 
 class FlextTapLdifUtilitiesProcessor:
     """MRO mixin exposing Processor under u.TapLdif."""
@@ -19,6 +43,8 @@ class FlextTapLdifUtilitiesProcessor:
     class Processor:
         """LDIF file processor using flext-ldif infrastructure."""
 
+        __slots__ = ("_api", "settings")
+
         def __init__(self, settings: t.ConfigurationMapping) -> None:
             """Initialize the LDIF processor."""
             self.settings = settings
@@ -40,9 +66,12 @@ class FlextTapLdifUtilitiesProcessor:
                         p = Path(file_path_text)
                     case _:
                         p = file_path
-                if not p.exists():
+                # One stat covers both the existence and the size check.
+                try:
+                    file_size = p.stat().st_size
+                except OSError:
                     return r[t.SequenceOf[Path]].fail(f"File not found: {p}")
-                if p.stat().st_size > max_size_bytes:
+                if file_size > max_size_bytes:
                     return r[t.SequenceOf[Path]].fail(f"File exceeds max size: {p}")
                 discovered.append(p)
                 return r[t.SequenceOf[Path]].ok(discovered)
@@ -52,17 +81,35 @@ class FlextTapLdifUtilitiesProcessor:
                         d = Path(directory_path_text)
                     case _:
                         d = directory_path
-                if not d.exists() or not d.is_dir():
-                    return r[t.SequenceOf[Path]].fail(f"Directory not found: {d}")
-                discovered.extend(
-                    f
-                    for f in sorted(d.glob(file_pattern))
-                    if f.is_file() and f.stat().st_size <= max_size_bytes
-                )
+                if "/" in file_pattern or "**" in file_pattern:
+                    # Patterns that traverse directories need Path.glob;
+                    # fnmatch against bare entry names can never match a
+                    # separator.
+                    if not d.is_dir():
+                        return r[t.SequenceOf[Path]].fail(f"Directory not found: {d}")
+                    candidates = sorted(d.glob(file_pattern))
+                else:
+                    try:
+                        with os.scandir(d) as dir_entries:
+                            candidates = sorted(
+                                Path(dir_entry.path)
+                                for dir_entry in dir_entries
+                                if fnmatch.fnmatch(dir_entry.name, file_pattern)
+                            )
+                    except OSError:
+                        return r[t.SequenceOf[Path]].fail(f"Directory not found: {d}")
+                for candidate in candidates:
+                    try:
+                        entry_stat = candidate.stat()
+                    except OSError:
+                        continue
+                    if (
+                        stat.S_ISREG(entry_stat.st_mode)
+                        and entry_stat.st_size <= max_size_bytes
+                    ):
+                        discovered.append(candidate)
                 return r[t.SequenceOf[Path]].ok(discovered)
-            return r[t.SequenceOf[Path]].fail(
-                "No file_path or directory_path specified"
-            )
+            return _NO_SOURCE_RESULT
 
         def process_file(
             self,
@@ -83,45 +130,129 @@ class FlextTapLdifUtilitiesProcessor:
                 if self.settings.get("strict_parsing", True):
                     raise
 
+        @staticmethod
+        def _iter_entry_blocks(file: Iterable[str]) -> Generator[str]:
+            """Yield one LDIF entry block at a time from an open text stream.
+
+            Blocks are separated by blank lines per RFC 2849, so memory stays
+            O(largest entry) instead of O(file size).
+            """
+            block_lines: list[str] = []
+            for line in file:
+                # First-character dispatch: anything not starting with a
+                # newline/space is content without paying the per-line
+                # strip() allocation; only separator candidates fall through.
+                if line[:1] not in {"", "\n", "\r", " "} or line.strip():
+                    block_lines.append(line)
+                elif block_lines:
+                    yield "".join(block_lines)
+                    block_lines = []
+            if block_lines:
+                yield "".join(block_lines)
+
+        @staticmethod
+        def _is_entry_block(block: str) -> bool:
+            """Return whether a block carries entry content worth parsing.
+
+            RFC 2849 allows a ``version:`` spec and comment-only runs before
+            the first entry; as standalone blocks they hold no entry, and
+            feeding them to the parser would fail files the whole-file parse
+            accepted.
+            """
+            for line in block.splitlines():
+                if not line or line[0] == "#" or line[0] == " ":
+                    continue
+                if line.lower().startswith("version:"):
+                    continue
+                return True
+            return False
+
+        @staticmethod
+        def _sniff_bom_encoding(prefix: bytes) -> str | None:
+            """Map a leading byte-order mark to its codec, if one is present."""
+            for bom, encoding in _BOM_ENCODINGS:
+                if prefix.startswith(bom):
+                    return encoding
+            return None
+
         def _yield_records(
             self,
             file_path: Path,
         ) -> Generator[t.JsonMapping]:
-            """Yield parsed Singer records from a file."""
+            """Yield parsed Singer records from a file, one entry at a time."""
             encoding = self.settings.get("encoding", c.DEFAULT_ENCODING)
             match encoding:
                 case str() as text_encoding:
                     file_encoding = text_encoding
                 case _:
                     file_encoding = c.DEFAULT_ENCODING
-            with file_path.open("r", encoding=file_encoding) as file:
-                content = file.read()
-            parse_result = self._api.parse_ldif(content)
+            # 1 MiB read buffer: LDIF dumps are read strictly sequentially,
+            # so fewer, larger syscalls beat the 8 KiB default.
+            with file_path.open("rb", buffering=_READ_BUFFER_SIZE) as raw:
+                # BOM probe on the already-open handle: when the config still
+                # carries the default encoding, a byte-order mark in the file
+                # is authoritative (a BOM-bearing file decoded as plain UTF-8
+                # would keep the mark in the first DN, or be garbage).
+                if file_encoding == c.DEFAULT_ENCODING:
+                    file_encoding = self._sniff_bom_encoding(raw.peek(4)) or (
+                        file_encoding
+                    )
+                file = io.TextIOWrapper(raw, encoding=file_encoding)
+                for block in self._iter_entry_blocks(file):
+                    if self._is_entry_block(block):
+                        yield from self._yield_block_records(block, file_path)
+
+        def _yield_block_records(
+            self,
+            block: str,
+            file_path: Path,
+        ) -> Generator[t.JsonMapping]:
+            """Parse a single entry block and yield its Singer records."""
+            parse_result = self._api.parse_ldif(block)
             if parse_result.failure:
                 msg: str = f"Failed to parse LDIF: {parse_result.error}"
                 self._raise_parse_error(msg)
+            # Per-record constants, resolved once per block instead of per
+            # entry.
+            entry_schema = c.TapLdif.EntrySchema
+            source_file = str(file_path)
+            validate_mapping = t.Cli.JSON_MAPPING_ADAPTER.validate_python
             for raw_entry in parse_result.value.entries:
-                entry = m.Ldif.Entry.model_validate(raw_entry)
+                # flext-ldif already validated its own entries; re-running
+                # model_validate per entry would only re-check invariants.
+                entry = (
+                    raw_entry
+                    if isinstance(raw_entry, m.Ldif.Entry)
+                    else m.Ldif.Entry.model_validate(raw_entry)
+                )
                 dn_val = entry.dn.value if entry.dn is not None else ""
-                attrs_dict: t.JsonMapping = t.Cli.JSON_MAPPING_ADAPTER.validate_python(
-                    {k: list(v) for k, v in entry.attributes.attributes.items()}
+                attrs_plain: dict[str, list[str]] = (
+                    {
+                        sys.intern(k): list(v)
+                        for k, v in entry.attributes.attributes.items()
+                    }
                     if entry.attributes is not None
-                    else {},
+                    else {}
                 )
-                yield t.Cli.JSON_MAPPING_ADAPTER.validate_python(
+                attrs_dict: t.JsonMapping = validate_mapping(attrs_plain)
+                # Size estimate from the data already in hand; stringifying
+                # and re-encoding the whole model per entry is not worth it.
+                entry_size = len(dn_val) + sum(
+                    len(attr_name) + sum(len(value) for value in values)
+                    for attr_name, values in attrs_plain.items()
+                )
+                yield validate_mapping(
                     {
-                        c.TapLdif.EntrySchema.DN_FIELD: dn_val,
-                        c.TapLdif.EntrySchema.ATTRIBUTES_FIELD: attrs_dict,
-                        c.TapLdif.EntrySchema.OBJECT_CLASS_FIELD: attrs_dict.get(
+                        entry_schema.DN_FIELD: dn_val,
+                        entry_schema.ATTRIBUTES_FIELD: attrs_dict,
+                        entry_schema.OBJECT_CLASS_FIELD: attrs_dict.get(
                             "objectClass",
                             [],
                         ),
-                        c.TapLdif.EntrySchema.CHANGE_TYPE_FIELD: c.TapLdif.EntrySchema.DEFAULT_CHANGE_TYPE,
-                        c.TapLdif.EntrySchema.SOURCE_FILE_FIELD: str(file_path),
-                        c.TapLdif.EntrySchema.LINE_NUMBER_FIELD: c.TapLdif.EntrySchema.DEFAULT_LINE_NUMBER,
-                        c.TapLdif.EntrySchema.ENTRY_SIZE_FIELD: len(
-                            str(entry).encode(c.DEFAULT_ENCODING)
-                        ),
+                        entry_schema.CHANGE_TYPE_FIELD: entry_schema.DEFAULT_CHANGE_TYPE,
+                        entry_schema.SOURCE_FILE_FIELD: source_file,
+                        entry_schema.LINE_NUMBER_FIELD: entry_schema.DEFAULT_LINE_NUMBER,
+                        entry_schema.ENTRY_SIZE_FIELD: entry_size,
                     },
                 )
 
@@ -78,12 +78,10 @@ class FlextTapLdifUtilitiesStateManagement:
             files_raw = state.get("files")
             files_dict: t.MutableJsonMapping = {}
             if u.mapping(files_raw):
-                for k, v in files_raw.items():
-                    if u.mapping(v):
-                        files_dict[k] = u.normalize_to_json_value(v)
+                # Sibling entries are already JSON values from previous
+                # updates; only the incoming file_state needs normalizing.
+                files_dict = {k: v for k, v in files_raw.items() if u.mapping(v)}
             files_dict[file_path] = u.normalize_to_json_value(file_state)
-            updated_state: t.MutableJsonMapping = {
-                key: u.normalize_to_json_value(value) for key, value in state.items()
-            }
-            updated_state["files"] = u.normalize_to_json_value(files_dict)
+            updated_state: t.MutableJsonMapping = dict(state)
+            updated_state["files"] = files_dict
             return updated_state
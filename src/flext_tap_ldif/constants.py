@@ -33,6 +33,13 @@ class FlextTapLdifConstants(c, FlextLdifConstants):
         # === Regex authority for the TapLdif domain ===
         ATTRIBUTE_NORMALIZE_RE: ClassVar[t.RegexPattern] = re.compile(r"[^a-zA-Z0-9]")
 
+        # str.translate table equivalent of ATTRIBUTE_NORMALIZE_RE for the
+        # ASCII range; built once at class load. Non-ASCII names fall back
+        # to the regex above.
+        ATTRIBUTE_NORMALIZE_TABLE: ClassVar[dict[int, str]] = {
+            code: (chr(code) if chr(code).isalnum() else "_") for code in range(128)
+        }
+
         DEFAULT_LDIF_ENCODING: Final[str] = FlextLdifConstants.Ldif.Encoding.UTF8
         DEFAULT_FILE_PATTERN: Final[str] = "*.ldif"
         DEFAULT_STRICT_PARSING: Final[bool] = True
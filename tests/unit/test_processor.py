@@ -0,0 +1,22 @@
+"""Behavior contract for the streaming LDIF processor — public API only."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from flext_tests import tm
+
+from flext_tap_ldif import u
+
+SAMPLE_LDIF = Path(__file__).resolve().parent.parent / "fixtures" / "sample.ldif"
+
+
+class TestsFlextTapLdifProcessor:
+    """Behavior contract for Processor.process_file."""
+
+    def test_process_file_streams_entries_past_version_and_comments(self) -> None:
+        processor = u.TapLdif.Processor({"strict_parsing": True})
+        records = list(processor.process_file(SAMPLE_LDIF))
+        tm.that(len(records), eq=2)
+        tm.that(records[0]["dn"], eq="cn=John Doe,ou=users,dc=example,dc=com")
+        tm.that(records[1]["dn"], eq="cn=Jane Roe,ou=users,dc=example,dc=com")